@@ -1,29 +1,56 @@
 import os
-import json
 import time
+import atexit
 import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import threading
+import hashlib
 import queue
 import re
+import shutil
+import tempfile
+from urllib.parse import urlsplit
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor
 
+import orjson
 import requests
+from cachetools import TTLCache
+import lxml.html
+from requests.adapters import HTTPAdapter
+import urllib3
+from urllib3.util.retry import Retry
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.remote_connection import ChromeRemoteConnection
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import JavascriptException, TimeoutException, WebDriverException
+from webdriver_manager.chrome import ChromeDriverManager
 
 # --- CONFIGURAÇÃO DE LOGS ---
 os.makedirs("logs", exist_ok=True)
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("logs/app.log"),
-        logging.StreamHandler()
-    ]
-)
+# O formato não usa thread/processo: evita preencher esses campos em cada registro
+logging.logThreads = False
+logging.logProcesses = False
+# Threads do bot só enfileiram o registro; a escrita em disco/console fica com o QueueListener
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_file_handler = RotatingFileHandler("logs/app.log", maxBytes=10*1024*1024, backupCount=3)
+_file_handler.setFormatter(_log_formatter)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(_log_formatter)
+
+_log_queue = queue.SimpleQueue()
+_queue_handler = QueueHandler(_log_queue)
+# O QueueHandler só resolve a mensagem; o formato completo é aplicado no listener
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+
+_log_listener = QueueListener(_log_queue, _file_handler, _stream_handler, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 # --- GERENCIAMENTO DE CONFIGURAÇÃO ---
@@ -37,16 +64,29 @@ class ConfigManager:
         return os.getenv("CHAT_ID")
 
     @staticmethod
-    def load_products():
+    def get_workers():
+        # Cada Chrome headless consome ~200-400 MB: ajuste conforme a RAM do container
+        return max(1, int(os.getenv("SCRAPER_WORKERS", "3")))
+
+    def __init__(self):
+        self._cached = None # (mtime_ns, produtos)
+
+    def load_products(self):
         try:
-            with open("config.json", "r") as f:
-                return json.load(f)
+            # Só relê o arquivo quando ele muda
+            st = os.stat("config.json")
+            if self._cached and self._cached[0] == st.st_mtime_ns:
+                return self._cached[1]
+            with open("config.json", "rb") as f:
+                data = orjson.loads(f.read())
+            self._cached = (st.st_mtime_ns, data)
+            return data
         except FileNotFoundError:
             logger.error("config.json não encontrado!")
             return []
 
 # --- SISTEMA DE NOTIFICAÇÃO ---
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Notification:
     message: str
     priority: int = 1
@@ -58,141 +98,398 @@ class BaseNotifier(ABC):
 
 class ConsoleNotifier(BaseNotifier):
     def send(self, notification: Notification):
-        logger.info(f"[CONSOLE] {notification.message}")
+        logger.info("[CONSOLE] %s", notification.message)
 
 class TelegramNotifier(BaseNotifier):
     def __init__(self, token, chat_id):
         self.token = token
         self.chat_id = chat_id
+        self._url = f"https://api.telegram.org/bot{token}/sendMessage"
+        # Keep-alive: alertas em rajada reaproveitam o mesmo túnel TLS
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=4,
+            # sendMessage não é idempotente: só repete quando a requisição certamente não foi
+            # processada (falha de conexão ou status de rejeição), nunca após erro de leitura
+            max_retries=Retry(
+                total=3,
+                connect=3,
+                read=0,
+                other=0,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["POST"],
+            ),
+        )
+        self.session.mount("https://", adapter)
     
     def send(self, notification: Notification):
         if not self.token or not self.chat_id:
             return
-        url = f"https://api.telegram.org/bot{self.token}/sendMessage"
         try:
-            requests.post(url, data={"chat_id": self.chat_id, "text": notification.message})
-            logger.info(f"[TELEGRAM] Enviado: {notification.message[:30]}...")
+            self.session.post(self._url, json={"chat_id": self.chat_id, "text": notification.message}, timeout=5)
+            logger.info("[TELEGRAM] Enviado: %s...", notification.message[:30])
         except Exception as e:
-            logger.error(f"[TELEGRAM] Falha: {e}")
+            logger.error("[TELEGRAM] Falha: %s", e)
 
 class AlertSystem:
+    # Envios simultâneos (console + Telegram hoje)
+    MAX_SEND_WORKERS = 3
+
     def __init__(self):
         self.notifiers = []
-        self._queue = queue.PriorityQueue()
+        # Só existem duas prioridades: uma fila para críticos e outra para info
+        self._crit = deque()
+        self._info = deque()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        # Um único pool para todos os envios, em vez de um por notificação
+        self._exec = ThreadPoolExecutor(max_workers=self.MAX_SEND_WORKERS, thread_name_prefix="notif")
+        # Alertas já enviados por (url, preço): memória limitada e expiração em 30 min
+        self._last_alert = TTLCache(maxsize=2048, ttl=1800) # 30 min cooldown
         self._running = True
         self._worker = threading.Thread(target=self._process_queue, daemon=True)
         self._worker.start()
-        self._last_alert = {} 
 
     def add_notifier(self, notifier: BaseNotifier):
         self.notifiers.append(notifier)
 
-    def notify(self, message, is_critical=False, product_url=None):
-        if product_url:
-            last_time = self._last_alert.get(product_url, 0)
-            if time.time() - last_time < 1800: # 30 min cooldown
-                logger.info(f"Alert suprimido (cooldown): {message[:20]}")
-                return
-            self._last_alert[product_url] = time.time()
+    @staticmethod
+    def _alert_key(product_url, price):
+        raw = f"{product_url}|{round(price, 2) if price is not None else ''}"
+        return hashlib.blake2b(raw.encode(), digest_size=8).digest()
+
+    def notify(self, message, is_critical=False, product_url=None, price=None):
+        key = self._alert_key(product_url, price) if product_url else None
+        with self._lock:
+            # Checa o cooldown antes de criar qualquer objeto
+            if key is not None:
+                if key in self._last_alert:
+                    logger.info("Alert suprimido (cooldown): %s", message[:20])
+                    return
+                self._last_alert[key] = 1
+            # As duas filas já garantem a ordem por prioridade: sem tuplas (prioridade, nota)
+            if is_critical:
+                self._crit.append(Notification(message, 0))
+            else:
+                self._info.append(Notification(message))
+        self._wake.set()
 
-        priority = 0 if is_critical else 1
-        self._queue.put((priority, Notification(message, priority)))
+    def _next_notification(self):
+        with self._lock:
+            if self._crit:
+                return self._crit.popleft()
+            if self._info:
+                return self._info.popleft()
+            return None
 
     def _process_queue(self):
         while self._running:
-            try:
-                priority, note = self._queue.get(timeout=1)
-                with ThreadPoolExecutor(max_workers=3) as executor:
-                    for notifier in self.notifiers:
-                        executor.submit(notifier.send, note)
-                self._queue.task_done()
-            except queue.Empty:
-                continue
+            self._wake.wait(timeout=1)
+            self._wake.clear()
+            # Expira aos poucos aqui, evitando uma limpeza em massa dentro do notify()
+            with self._lock:
+                self._last_alert.expire()
+            # Esvazia tudo: críticos sempre antes dos informativos
+            note = self._next_notification()
+            while note is not None and self._running:
+                for notifier in self.notifiers:
+                    self._exec.submit(notifier.send, note)
+                note = self._next_notification()
+
+    def close(self):
+        self._running = False
+        self._wake.set()
+        # Só fecha o pool depois que o worker parou de submeter envios
+        self._worker.join(timeout=5)
+        self._exec.shutdown(wait=False)
 
 # --- EXTRAÇÃO DE PREÇOS (ATUALIZADO) ---
-class PriceExtractor:
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# Sites que entregam o preço no HTML do servidor (não precisam de Chrome)
+STATIC_HOSTS = {"terabyteshop.com.br"}
+
+def match_domain(url, domains):
+    # Domínio exato ou subdomínio (www.kabum.com.br), nunca "kabum.com.br.exemplo"
+    host = urlsplit(url).hostname or ""
+    return next((d for d in domains if host == d or host.endswith("." + d)), None)
+
+def is_static_host(url):
+    return match_domain(url, STATIC_HOSTS) is not None
+
+# Regex poderoso para pegar "399,99" ou "1.200,00"
+_PRICE_RE = re.compile(r'[\d.]+,\d{2}|\d[\d.]*\d{2}')
+
+def parse_price(texto_preco):
+    match = _PRICE_RE.search(texto_preco)
+    if match:
+        valor_limpo = match.group(0).replace('R$', '').replace('.', '').replace(',', '.')
+        return float(valor_limpo)
+    return None
+
+class StaticHTMLExtractor:
     def __init__(self):
+        # Sessão persistente: reaproveita a conexão TLS por host entre as varreduras
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=2, backoff_factor=0.3),
+        )
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"User-Agent": USER_AGENT})
+
+    def get_price(self, url):
+        try:
+            logger.info("Acessando (HTML estático): %s", url)
+            r = self.session.get(url, timeout=10)
+            r.raise_for_status()
+            tree = lxml.html.fromstring(r.content)
+            texto_preco = "".join(tree.xpath('//*[@id="valVista"]//text()')).strip()
+            if texto_preco:
+                return parse_price(texto_preco)
+            logger.warning("Preço não encontrado no HTML estático: %s", url)
+            return None
+        except Exception as e:
+            logger.error("Erro ao ler HTML estático: %s", e)
+            return None
+
+# --- ESTRATÉGIAS DE SELEÇÃO ---
+# Tempo máximo esperando o preço aparecer no DOM (sai antes se já estiver lá)
+PRICE_WAIT_TIMEOUT = 8
+
+# Busca e limpeza numa única ida ao navegador: testa os XPaths em ordem e já devolve
+# só o trecho do preço (mesmo padrão do _PRICE_RE), ou "" se ainda não apareceu
+_PRICE_JS = """
+for (const xpath of arguments[0]) {
+    const el = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    if (!el) continue;
+    const match = (el.innerText || el.textContent || "").match(/[\\d.]+,\\d{2}|\\d[\\d.]*\\d{2}/);
+    if (match) return match[0];
+}
+return "";
+"""
+
+# Pega o primeiro elemento H4 que contenha "R$"
+_GENERIC_XPATHS = ["//h4[contains(text(), 'R$')]"]
+
+_SITE_XPATHS = {
+    # Bloco de preço final (Classes mudam, mas 'finalPrice' é comum) ou qualquer H4 do bloco de valores
+    "kabum.com.br": ["//*[contains(@class, 'finalPrice')]", "//*[@id='blocoValores']//h4"],
+    "terabyteshop.com.br": ["//*[@id='valVista']"],
+    # Pichau: Pega o elemento que tem o preço à vista
+    "pichau.com.br": ["//*[contains(text(), 'à vista')]/preceding-sibling::div"],
+}
+
+def resolve_xpaths(url):
+    domain = match_domain(url, _SITE_XPATHS)
+    return _SITE_XPATHS[domain] if domain else _GENERIC_XPATHS
+
+def _extract_price_text(driver, xpaths):
+    try:
+        return driver.execute_script(_PRICE_JS, xpaths) or ""
+    except JavascriptException:
+        # Página no meio de uma navegação/XPath inválido: trata como "ainda não achou"
+        return ""
+
+# Só precisamos do texto do preço: imagens, fontes e rastreadores são peso morto
+BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.webp", "*.gif",
+    "*.woff", "*.woff2", "*.mp4",
+    "*google-analytics*", "*googletagmanager*", "*facebook.net*", "*doubleclick*",
+]
+
+CHROME_LEAN_FLAGS = [
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--disable-default-apps",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-renderer-backgrounding",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-features=TranslateUI,MediaRouter",
+]
+
+def find_chromedriver():
+    # Docker instala o chromium-driver no PATH; fora dele, baixa um compatível via webdriver-manager
+    path = shutil.which("chromedriver")
+    if path:
+        return path
+    try:
+        return ChromeDriverManager().install()
+    except Exception as e:
+        raise RuntimeError(f"chromedriver não encontrado no PATH nem via webdriver-manager: {e}") from e
+
+class PriceExtractor:
+    # Recicla o Chrome a cada N páginas para conter vazamento de memória
+    MAX_PAGES_PER_SESSION = 100
+
+    def __init__(self, static=None):
         self.options = Options()
-        self.options.add_argument("--headless")
+        # driver.get retorna no DOMContentLoaded; a espera pelo preço fica com o WebDriverWait
+        self.options.page_load_strategy = "eager"
+        self.options.add_argument("--headless=new")
         self.options.add_argument("--no-sandbox")
         self.options.add_argument("--disable-dev-shm-usage")
         self.options.add_argument("--disable-gpu")
+        # Corta serviços de fundo do Chrome que não servem para raspagem
+        for flag in CHROME_LEAN_FLAGS:
+            self.options.add_argument(flag)
+        # Perfil próprio e vazio: cada navegador do pool precisa do seu, e evita varrer o perfil padrão
+        self._profile_dir = tempfile.mkdtemp(prefix="spell-hunter-chrome-")
+        self.options.add_argument(f"--user-data-dir={self._profile_dir}")
         self.options.add_argument("--window-size=1920,1080") # Evita layout mobile
         # Truque Anti-Bot: Desativa flag de automação
         self.options.add_argument("--disable-blink-features=AutomationControlled") 
         # User-Agent Moderno (Chrome 120)
-        self.options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+        self.options.add_argument(f"user-agent={USER_AGENT}")
+        # Não baixa imagens (reforço do bloqueio via CDP)
+        self.options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
         
+        # Compartilhado entre os extratores do pool: um único pool de conexões por host
+        self.static = static or StaticHTMLExtractor()
+        # Resolvido já na inicialização: sem driver o bot não deve nem começar a varrer
+        self._driver_path = find_chromedriver()
+        self.service = None
         self.driver = None
+        self._pages_served = 0
+        atexit.register(self.stop_driver)
 
     def start_driver(self):
+        # O chromedriver sobe uma única vez; só a sessão do navegador é recriada
+        if not self.service:
+            service = Service(executable_path=self._driver_path)
+            service.start()
+            self.service = service
         if not self.driver:
-            self.driver = webdriver.Chrome(options=self.options)
+            # ChromeRemoteConnection habilita o endpoint de CDP que o Remote genérico não expõe
+            executor = ChromeRemoteConnection(remote_server_addr=self.service.service_url)
+            self.driver = webdriver.Remote(command_executor=executor, options=self.options)
+            self._pages_served = 0
+            self.execute_cdp_cmd("Network.enable", {})
+            self.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
 
-    def stop_driver(self):
+    def execute_cdp_cmd(self, cmd, params):
+        return self.driver.execute("executeCdpCommand", {"cmd": cmd, "params": params})["value"]
+
+    def recycle_driver(self):
         if self.driver:
-            self.driver.quit()
+            try:
+                self.driver.quit()
+            except Exception as e:
+                logger.warning("Falha ao encerrar sessão do Chrome: %s", e)
             self.driver = None
+        # Se o próprio chromedriver caiu, descarta o serviço para subir um novo na próxima chamada
+        if self.service and not self.service.is_connectable():
+            logger.warning("chromedriver não responde, reiniciando serviço...")
+            self._stop_service()
+
+    def _stop_service(self):
+        try:
+            self.service.stop()
+        except Exception as e:
+            logger.warning("Falha ao encerrar chromedriver: %s", e)
+        self.service = None
+
+    def stop_driver(self):
+        self.recycle_driver()
+        if self.service:
+            self._stop_service()
+        shutil.rmtree(self._profile_dir, ignore_errors=True)
 
     def get_price(self, url):
-        self.start_driver()
-        
-        # Correção do erro Pylance (Segurança)
-        if not self.driver:
-            return None
+        if is_static_host(url):
+            price = self.static.get_price(url)
+            if price:
+                return price
+            # HTML mudou ou fomos bloqueados: tenta com o navegador
+            logger.info("Fallback para o Chrome...")
 
         try:
-            logger.info(f"Acessando: {url}")
+            if self._pages_served >= self.MAX_PAGES_PER_SESSION:
+                logger.info("Reciclando sessão do Chrome...")
+                self.recycle_driver()
+            self.start_driver()
+
+            # Correção do erro Pylance (Segurança)
+            if not self.driver:
+                return None
+
+            logger.info("Acessando: %s", url)
+            self._pages_served += 1
             self.driver.get(url)
-            time.sleep(5) # Espera um pouco mais para carregar scripts
 
-            texto_preco = ""
-            
-            # --- ESTRATÉGIAS DE SELEÇÃO ---
+            xpaths = resolve_xpaths(url)
             try:
-                if "kabum" in url:
-                    # Tenta pegar pelo bloco de preço final (Classes mudam, mas 'finalPrice' é comum)
-                    elements = self.driver.find_elements(By.XPATH, "//*[contains(@class, 'finalPrice')]")
-                    if elements:
-                        texto_preco = elements[0].text
-                    else:
-                        # Estratégia Genérica: Procura qualquer H4 dentro do bloco de valores
-                        el = self.driver.find_element(By.XPATH, "//*[@id='blocoValores']//h4")
-                        texto_preco = el.text
-
-                elif "terabyteshop" in url:
-                    texto_preco = self.driver.find_element(By.ID, "valVista").text
-
-                elif "pichau" in url:
-                    # Pichau: Pega o elemento que tem o preço à vista
-                    el = self.driver.find_element(By.XPATH, "//*[contains(text(), 'à vista')]/preceding-sibling::div")
-                    texto_preco = el.text
-            except Exception as e:
+                # Reexecuta o script até o preço aparecer: uma ida ao navegador por tentativa
+                texto_preco = WebDriverWait(self.driver, PRICE_WAIT_TIMEOUT).until(
+                    lambda d: _extract_price_text(d, xpaths)
+                )
+            except TimeoutException:
+                texto_preco = ""
                 # Se falhar o seletor específico, tenta achar qualquer "R$" grande na tela
-                # Pega apenas a primeira linha do erro, sem o resto gigante
-                erro_curto = str(e).split('\n')[0]
-                logger.warning(f"Seletor padrão falhou, ativando busca genérica... (Erro: {erro_curto})")
-                try:
-                    # Pega o primeiro elemento H4 ou div que contenha "R$" e seja visível
-                    generic = self.driver.find_element(By.XPATH, "//h4[contains(text(), 'R$')]")
-                    texto_preco = generic.text
-                except: pass
+                if xpaths is not _GENERIC_XPATHS:
+                    logger.warning("Seletor padrão falhou, ativando busca genérica...")
+                    # Página já teve tempo de carregar na espera acima: busca direta, sem nova espera
+                    texto_preco = _extract_price_text(self.driver, _GENERIC_XPATHS)
 
             # --- LIMPEZA E CONVERSÃO ---
             if texto_preco:
-                # Regex poderoso para pegar "399,99" ou "1.200,00"
-                match = re.search(r'[\d\.]+, \d{2}|[\d\.]+\d{2}', texto_preco)
-                if match:
-                    valor_limpo = match.group(0).replace('R$', '').replace('.', '').replace(',', '.')
-                    return float(valor_limpo)
+                price = parse_price(texto_preco)
+                if price is not None:
+                    return price
             
             # Debug: Se falhar, mostra o título da página para saber se fomos bloqueados
-            logger.warning(f"Preço não encontrado. Título da página: {self.driver.title}")
+            if logger.isEnabledFor(logging.WARNING):
+                # driver.title é mais uma ida ao navegador: só busca se o log for emitido
+                logger.warning("Preço não encontrado. Título da página: %s", self.driver.title)
+            return None
+
+        except (WebDriverException, urllib3.exceptions.HTTPError) as e:
+            # Sessão (ou o chromedriver) provavelmente morreu; força reconexão no próximo produto
+            erro_curto = str(e).split('\n')[0]
+            logger.error("Erro do WebDriver, reciclando sessão: %s", erro_curto)
+            self.recycle_driver()
+            return None
+        except Exception as e:
+            logger.error("Erro crítico ao ler página: %s", e)
             return None
 
+# Mantém K navegadores persistentes; cada thread pega um emprestado por URL
+class ExtractorPool:
+    def __init__(self, size):
+        self._pool = queue.Queue()
+        static = StaticHTMLExtractor()
+        self._extractors = [PriceExtractor(static) for _ in range(size)]
+        for ext in self._extractors:
+            self._pool.put(ext)
+        self._exec = ThreadPoolExecutor(max_workers=size, thread_name_prefix="scraper")
+
+    def get_price(self, url):
+        ext = self._pool.get()
+        try:
+            return ext.get_price(url)
         except Exception as e:
-            logger.error(f"Erro crítico ao ler página: {e}")
+            # Uma URL com problema não pode derrubar a varredura inteira
+            logger.error("Erro ao ler %s: %s", url, e)
             return None
+        finally:
+            self._pool.put(ext)
+
+    def get_prices(self, urls):
+        # Varre em paralelo; os resultados voltam na mesma ordem das URLs
+        return list(self._exec.map(self.get_price, urls))
+
+    def stop(self):
+        # Espera as leituras em andamento antes de fechar os navegadores e apagar os perfis
+        self._exec.shutdown(wait=True, cancel_futures=True)
+        for ext in self._extractors:
+            ext.stop_driver()
 
 # --- LOOP PRINCIPAL ---
 def main():
@@ -200,7 +497,7 @@ def main():
     
     config = ConfigManager()
     alerts = AlertSystem()
-    extractor = PriceExtractor()
+    pool = ExtractorPool(config.get_workers())
     
     alerts.add_notifier(ConsoleNotifier())
     if config.get_token():
@@ -210,31 +507,32 @@ def main():
     try:
         while True:
             products = config.load_products()
-            logger.info(f"--- Varrendo {len(products)} produtos ---")
+            logger.info("--- Varrendo %d produtos ---", len(products))
             
-            for item in products:
+            prices = pool.get_prices([item.get('url') for item in products])
+
+            for item, current_price in zip(products, prices):
                 url = item.get('url')
                 target = item.get('target_price', 0)
                 name = item.get('name', 'Produto Desconhecido')
                 
-                current_price = extractor.get_price(url)
-                
                 if current_price:
-                    logger.info(f"[{name}] Preço: R$ {current_price:.2f} | Alvo: R$ {target:.2f}")
+                    logger.info("[%s] Preço: R$ %.2f | Alvo: R$ %.2f", name, current_price, target)
                     
                     # AQUI ESTÁ A LÓGICA DE COMPARAÇÃO
                     if 0 < current_price <= target:
                         msg = f"🚨 PROMOÇÃO DETECTADA!\n\n📦 {name}\n💰 De: R$ {target}\n📉 Por: R$ {current_price:.2f}\n🔗 {url}"
-                        alerts.notify(msg, is_critical=True, product_url=url)
+                        alerts.notify(msg, is_critical=True, product_url=url, price=current_price)
                 else:
-                    logger.warning(f"Falha na leitura de {name}")
+                    logger.warning("Falha na leitura de %s", name)
 
             logger.info("Dormindo 60 segundos...")
             time.sleep(60)
 
     except KeyboardInterrupt:
         logger.info("Parando Bot...")
-        extractor.stop_driver()
+        alerts.close()
+        pool.stop()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file